@@ -10,6 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import logging
+import sys
 from typing import Any
 
 from core.Mod import Component, Mod
@@ -29,6 +30,10 @@ class ReferenceType(Enum):
     SUB_OPTION = auto()  # mod_id:X.Y.Z
 
 
+# Flyweight cache shared by all factory methods, keyed by normalized (mod_id, comp_key)
+_INTERN_CACHE: dict[tuple[str, str], ComponentReference] = {}
+
+
 # ============================================================================
 # Component Reference
 # ============================================================================
@@ -51,15 +56,33 @@ class ComponentReference:
 
     mod_id: str
     comp_key: str
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate and normalize reference."""
-        object.__setattr__(self, "mod_id", self.mod_id.lower())
+        # Interned: references of one mod share their mod_id, so comparing mod ids
+        # (selected mods, whole-mod targets) short-circuits on identity
+        object.__setattr__(self, "mod_id", sys.intern(self.mod_id.lower()))
+        object.__setattr__(self, "comp_key", sys.intern(self.comp_key))
+        object.__setattr__(self, "_hash", hash((self.mod_id, self.comp_key)))
 
     # ========================================
     # Factory Methods
     # ========================================
 
+    @classmethod
+    def intern(cls, mod_id: str, comp_key: str) -> ComponentReference:
+        """Get the shared instance for a reference, creating it on first use.
+
+        Equal references built through the factory methods are the same object,
+        so set and dict lookups resolve on identity before falling back to equality.
+        """
+        key = (mod_id.lower(), comp_key)
+        reference = _INTERN_CACHE.get(key)
+        if reference is None:
+            reference = _INTERN_CACHE.setdefault(key, cls(*key))
+        return reference
+
     @classmethod
     def from_string(cls, reference_str: str) -> ComponentReference:
         """Create reference from string.
@@ -84,17 +107,17 @@ class ComponentReference:
         if not mod_id or not comp_key:
             raise ValueError(f"Invalid reference format: {reference_str}")
 
-        return cls(mod_id, comp_key)
+        return cls.intern(mod_id, comp_key)
 
     @classmethod
     def for_mod(cls, mod_id: str) -> ComponentReference:
         """Create mod reference."""
-        return cls(mod_id, "*")
+        return cls.intern(mod_id, "*")
 
     @classmethod
     def for_component(cls, mod_id: str, comp_key: str) -> ComponentReference:
         """Create component reference."""
-        return cls(mod_id, comp_key)
+        return cls.intern(mod_id, comp_key)
 
     # ========================================
     # String Representation
@@ -109,8 +132,16 @@ class ComponentReference:
         return f"ComponentReference('{self.mod_id}:{self.comp_key}')"
 
     def __hash__(self) -> int:
-        """Make hashable for use in sets/dicts."""
-        return hash((self.mod_id, self.comp_key))
+        """Make hashable for use in sets/dicts (computed once at creation)."""
+        return self._hash
+
+    def __lt__(self, other: object) -> bool:
+        """Order by mod id then component key, so references sort without a key function."""
+        if not isinstance(other, ComponentReference):
+            return NotImplemented
+        if self.mod_id != other.mod_id:
+            return self.mod_id < other.mod_id
+        return self.comp_key < other.comp_key
 
     # ========================================
     # Type Detection
@@ -175,7 +206,7 @@ class ComponentReference:
             "mod:10.1.2" -> "mod:10"
         """
         base_key = self.get_base_component_key()
-        return ComponentReference(self.mod_id, base_key)
+        return ComponentReference.intern(self.mod_id, base_key)
 
     # ========================================
     # Conversion Utilities
@@ -243,6 +274,7 @@ class ReferenceIndexes:
 
     # Violations/conflicts
     selection_violation_index: dict[ComponentReference, list[Any]] = field(default_factory=dict)
+    selection_violations: list[Any] = field(default_factory=list)  # Each violation once
 
     # Violations/order
     order_violation_index: dict[ComponentReference, list[Any]] = field(default_factory=dict)
@@ -352,6 +384,7 @@ class ReferenceIndexes:
 
     def add_selection_violation(self, violation: Any) -> None:
         """Add a violation to all affected components."""
+        self.selection_violations.append(violation)
         for reference in violation.affected_components:
             if reference not in self.selection_violation_index:
                 self.selection_violation_index[reference] = []
@@ -367,7 +400,11 @@ class ReferenceIndexes:
 
     def clear_selection_violations(self) -> None:
         """Clear all violations."""
+        # Every violation is in the flat list: empty means the index is already clean
+        if not self.selection_violations:
+            return
         self.selection_violation_index.clear()
+        self.selection_violations.clear()
 
     # ========================================
     # Violation Index - Order
@@ -490,6 +527,7 @@ class ReferenceIndexes:
         self.tree_item_index.clear()
         self.selection_index.clear()
         self.selection_violation_index.clear()
+        self.selection_violations.clear()
         self.order_violation_index.clear()
         self.parent_index.clear()
         self.children_index.clear()
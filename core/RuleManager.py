@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from itertools import chain
 import json
 import logging
+from operator import itemgetter
+import os
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
@@ -21,7 +26,6 @@ from core.Rules import (
     OrderDirection,
     OrderRule,
     Rule,
-    RuleType,
     RuleViolation,
 )
 from core.TranslationManager import SUPPORTED_LANGUAGES, get_translator, tr
@@ -46,8 +50,10 @@ class ComponentSet:
     def get_references(self) -> tuple[ComponentReference, ...]:
         """Convert to ComponentReferences."""
         if self.component_keys is None:
-            return (ComponentReference(self.mod_id, "*"),)
-        return tuple(ComponentReference(self.mod_id, key) for key in self.component_keys)
+            return (ComponentReference.for_mod(self.mod_id),)
+        return tuple(
+            ComponentReference.for_component(self.mod_id, key) for key in self.component_keys
+        )
 
     @classmethod
     def parse(cls, text: str) -> ComponentSet:
@@ -205,7 +211,7 @@ class RuleExpression:
         return rule
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationState:
     """Valdiation state."""
 
@@ -219,8 +225,39 @@ class ValidationState:
 
     def update_positions(self, order: list[ComponentReference]) -> None:
         """Update positions AND active components set."""
-        self.positions = {ref: idx for idx, ref in enumerate(order)}
-        self.active_components = set(order)
+        self.positions = dict(zip(order, range(len(order)), strict=True))
+        self.active_components = set(self.positions)
+
+
+# Selection check bound to one rule: (source reference, selected components, selected mod ids)
+SelectionChecker = Callable[
+    [ComponentReference, frozenset[ComponentReference], frozenset[str]], RuleViolation | None
+]
+
+
+@dataclass(frozen=True, slots=True)
+class LoadedRules:
+    """Rules and indexes built from one language cache."""
+
+    dependency_rules: list[DependencyRule]
+    incompatibility_rules: list[IncompatibilityRule]
+    order_rules: list[OrderRule]
+    all_rules: list[Rule]
+    rules_by_component: dict[ComponentReference, tuple[Rule, ...]]
+    selection_rules_by_component: dict[
+        ComponentReference, tuple[DependencyRule | IncompatibilityRule, ...]
+    ]
+    dependency_rules_by_component: dict[ComponentReference, tuple[DependencyRule, ...]]
+    rules_by_mod_source: dict[str, tuple[DependencyRule | IncompatibilityRule, ...]]
+    selection_rules_by_reference: dict[
+        ComponentReference, tuple[DependencyRule | IncompatibilityRule, ...]
+    ]
+    components_by_mod: dict[str, frozenset[ComponentReference]]
+    resolved_wildcards: dict[
+        int, tuple[frozenset[ComponentReference], frozenset[ComponentReference]]
+    ]
+    order_directions: dict[int, OrderDirection]
+    selection_checkers: dict[int, SelectionChecker]
 
 
 class RuleCacheBuilderThread(QThread):
@@ -246,6 +283,11 @@ class RuleCacheBuilderThread(QThread):
         self.languages = languages
         self._should_stop = False
 
+        # Progress across all languages
+        self._current_step = 0
+        self._total_steps = 1
+        self._last_progress = 0
+
     def run(self) -> None:
         """Build cache for all languages."""
         try:
@@ -257,46 +299,27 @@ class RuleCacheBuilderThread(QThread):
                 "order": self.rules_dir / "order.json",
             }
 
+            # Languages whose cache is newer than every source file need no rebuild
+            source_mtime = max(
+                (f.stat().st_mtime for f in source_files.values() if f.exists()), default=0.0
+            )
+            languages = [
+                lang
+                for lang in self.languages
+                if not self._is_cache_current(lang, source_mtime)
+            ]
+
+            if not languages:
+                logger.info("Rule caches are up to date, skipping generation")
+                self.progress.emit(100)
+                self.finished.emit(True)
+                return
+
             self.status_changed.emit(tr("app.parsing_rules"))
-            source_data = {}
-
-            for rule_type, file_path in source_files.items():
-                if file_path.exists():
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            raw_rules = data.get("rules", [])
-
-                            expanded_rules = []
-                            for rule in raw_rules:
-                                try:
-                                    expression = RuleExpression.parse(rule["rule"])
-
-                                    if rule_type == "incompatibilities":
-                                        expanded = expression.to_incompatibility_rules(rule)
-                                        expanded_rules.extend(expanded)
-
-                                    elif rule_type == "dependencies":
-                                        expanded_rule = expression.to_dependency_rule(rule)
-                                        expanded_rules.append(expanded_rule)
-
-                                    elif rule_type == "order":
-                                        expanded_rule = expression.to_order_rule(rule)
-                                        expanded_rules.append(expanded_rule)
-
-                                except Exception as e:
-                                    logger.error(
-                                        f"Error expanding rule '{rule.get('rule')}': {e}"
-                                    )
-
-                            source_data[rule_type] = expanded_rules
-
-                    except Exception as e:
-                        logger.error(f"Error loading {file_path.name}: {e}")
-                        source_data[rule_type] = []
-                else:
-                    logger.warning(f"Rule file not found: {file_path}")
-                    source_data[rule_type] = []
+            source_data = {
+                rule_type: self._load_source_file(rule_type, file_path)
+                for rule_type, file_path in source_files.items()
+            }
 
             # Count total rules for progress tracking
             total_rules = sum(len(rules) for rules in source_data.values())
@@ -306,44 +329,18 @@ class RuleCacheBuilderThread(QThread):
 
             self.progress.emit(10)  # Initial progress
 
-            total_languages = len(self.languages)
-            current_step = 0
-            total_steps = total_languages * total_rules if total_rules > 0 else total_languages
+            total_languages = len(languages)
+            self._current_step = 0
+            self._total_steps = (
+                total_languages * total_rules if total_rules > 0 else total_languages
+            )
+            self._last_progress = 10
 
-            for lang in self.languages:
-                if self._should_stop:
+            for lang in languages:
+                if not self._build_cache_for_language(lang, source_data):
                     self.finished.emit(False)
                     return
 
-                self.status_changed.emit(tr("app.generating_cache_for_lang", lang=lang))
-
-                # Localize all rule types
-                localized_data = {}
-
-                for rule_type, rules_list in source_data.items():
-                    localized_rules = []
-
-                    for rule in rules_list:
-                        if self._should_stop:
-                            self.finished.emit(False)
-                            return
-
-                        localized_rules.append(self._localize_rule(rule, lang))
-
-                        current_step += 1
-                        # Progress 10-100%
-                        progress_value = 10 + int((current_step / total_steps) * 90)
-                        self.progress.emit(progress_value)
-
-                    localized_data[rule_type] = localized_rules
-
-                # Save cache
-                cache_path = self.cache_dir / f"rules_{lang}.json"
-                with open(cache_path, "w", encoding="utf-8") as f:
-                    json.dump(localized_data, f, indent=2, ensure_ascii=False)
-
-                logger.info(f"Rule cache generated for {lang}: {cache_path}")
-
             self.status_changed.emit(tr("app.cache_generated_successfully"))
             self.progress.emit(100)
             self.finished.emit(True)
@@ -357,6 +354,111 @@ class RuleCacheBuilderThread(QThread):
         """Request thread to stop gracefully."""
         self._should_stop = True
 
+    @staticmethod
+    def _load_source_file(rule_type: str, file_path: Path) -> list[dict[str, Any]]:
+        """
+        Read one rule source file and expand its rule expressions.
+
+        Args:
+            rule_type: Rule type of the file (dependencies, incompatibilities, order)
+            file_path: Path to the source file
+
+        Returns:
+            Expanded rules, empty if the file is missing or unreadable
+        """
+        if not file_path.exists():
+            logger.warning(f"Rule file not found: {file_path}")
+            return []
+
+        try:
+            data = json.loads(file_path.read_bytes())
+            raw_rules = data.get("rules", [])
+
+            expanded_rules = []
+            for rule in raw_rules:
+                try:
+                    expression = RuleExpression.parse(rule["rule"])
+
+                    if rule_type == "incompatibilities":
+                        expanded = expression.to_incompatibility_rules(rule)
+                        expanded_rules.extend(expanded)
+
+                    elif rule_type == "dependencies":
+                        expanded_rule = expression.to_dependency_rule(rule)
+                        expanded_rules.append(expanded_rule)
+
+                    elif rule_type == "order":
+                        expanded_rule = expression.to_order_rule(rule)
+                        expanded_rules.append(expanded_rule)
+
+                except Exception as e:
+                    logger.error(f"Error expanding rule '{rule.get('rule')}': {e}")
+
+            return expanded_rules
+
+        except Exception as e:
+            logger.error(f"Error loading {file_path.name}: {e}")
+            return []
+
+    def _build_cache_for_language(
+        self, lang: str, source_data: dict[str, list[dict[str, Any]]]
+    ) -> bool:
+        """
+        Localize all rules for one language and write its cache file.
+
+        Args:
+            lang: Target language code
+            source_data: Expanded rules by rule type
+
+        Returns:
+            False if the build was stopped, True otherwise
+        """
+        if self._should_stop:
+            return False
+
+        self.status_changed.emit(tr("app.generating_cache_for_lang", lang=lang))
+
+        # Localize all rule types
+        localized_data = {}
+
+        for rule_type, rules_list in source_data.items():
+            if self._should_stop:
+                return False
+
+            localized_data[rule_type] = [self._localize_rule(rule, lang) for rule in rules_list]
+            self._advance_progress(len(rules_list))
+
+        # Save cache through a temporary file so readers never see a partial cache.
+        # Machine-read only: compact output keeps the file (and load_cache reads) small
+        cache_path = self.cache_dir / f"rules_{lang}.json"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(localized_data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Rule cache generated for {lang}: {cache_path}")
+        return True
+
+    def _is_cache_current(self, lang: str, source_mtime: float) -> bool:
+        """Check if the cache file for a language is newer than all source files."""
+        cache_path = self.cache_dir / f"rules_{lang}.json"
+        try:
+            return cache_path.stat().st_mtime >= source_mtime
+        except OSError:
+            return False
+
+    def _advance_progress(self, steps: int) -> None:
+        """Advance progress (10-100%), emitting only when the percentage changes."""
+        self._current_step += steps
+        progress_value = 10 + (self._current_step * 90) // self._total_steps
+        if progress_value != self._last_progress:
+            self._last_progress = progress_value
+            self.progress.emit(progress_value)
+
     @staticmethod
     def _localize_rule(rule: dict[str, Any], target_lang: str) -> dict[str, Any]:
         """
@@ -370,8 +472,12 @@ class RuleCacheBuilderThread(QThread):
             target_lang: Target language code
 
         Returns:
-            Localized rule dictionary
+            Localized rule dictionary (the input itself when there is nothing to localize)
         """
+        if "translations" not in rule:
+            # Shared across languages: the caller only serializes it
+            return rule if "description" in rule else {**rule, "description": ""}
+
         result = rule.copy()
         translations = rule.get("translations", {})
 
@@ -404,11 +510,15 @@ class RuleCacheBuilderThread(QThread):
 class ConditionEvaluator(Protocol):
     """Protocol for evaluating source/target conditions."""
 
-    def is_satisfied(self, selected_set: set[ComponentReference]) -> bool:
+    def is_satisfied(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> bool:
         """Check if condition is satisfied."""
         ...
 
-    def get_missing(self, selected_set: set[ComponentReference]) -> list[ComponentReference]:
+    def get_missing(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
         """Get missing components."""
         ...
 
@@ -416,33 +526,52 @@ class ConditionEvaluator(Protocol):
 class StandardCondition:
     """Evaluates standard source/target."""
 
-    __slots__ = ("components", "mode", "_matcher")
+    __slots__ = ("components", "mode")
 
-    def __init__(
-        self,
-        components: tuple[ComponentReference, ...],
-        mode: DependencyMode,
-        matcher: Callable[[ComponentReference, set[ComponentReference]], bool],
-    ):
+    def __init__(self, components: tuple[ComponentReference, ...], mode: DependencyMode):
         self.components = components
         self.mode = mode
-        self._matcher = matcher
 
-    def is_satisfied(self, selected_set: set[ComponentReference]) -> bool:
+    def is_satisfied(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> bool:
         """Check if condition is met."""
-        matches = [self._matcher(comp, selected_set) for comp in self.components]
-
         if self.mode == DependencyMode.ALL:
-            return all(matches)
-        return any(matches)
+            for comp in self.components:
+                if comp.is_mod():
+                    if comp.mod_id not in selected_mods:
+                        return False
+                elif comp not in selected_set:
+                    return False
+            return True
+
+        for comp in self.components:
+            if comp.is_mod():
+                if comp.mod_id in selected_mods:
+                    return True
+            elif comp in selected_set:
+                return True
+        return False
 
-    def get_missing(self, selected_set: set[ComponentReference]) -> list[ComponentReference]:
+    def get_missing(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
         """Get components that don't match."""
-        return [comp for comp in self.components if not self._matcher(comp, selected_set)]
+        return [
+            comp
+            for comp in self.components
+            if not ComponentGroup.matches_reference(comp, selected_set, selected_mods)
+        ]
 
-    def get_matching(self, selected_set: set[ComponentReference]) -> list[ComponentReference]:
+    def get_matching(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
         """Get components that match."""
-        return [comp for comp in self.components if self._matcher(comp, selected_set)]
+        return [
+            comp
+            for comp in self.components
+            if ComponentGroup.matches_reference(comp, selected_set, selected_mods)
+        ]
 
 
 class GroupCondition:
@@ -453,47 +582,33 @@ class GroupCondition:
     def __init__(self, groups: tuple[ComponentGroup, ...]):
         self.groups = groups
 
-    def is_satisfied(self, selected_set: set[ComponentReference]) -> bool:
+    def is_satisfied(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> bool:
         """All groups must be satisfied."""
-        return all(group.matches(selected_set) for group in self.groups)
+        return all(group.matches(selected_set, selected_mods) for group in self.groups)
 
-    def get_missing(self, selected_set: set[ComponentReference]) -> list[ComponentReference]:
+    def get_missing(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
         """Get missing components from unsatisfied groups."""
         missing = []
         for group in self.groups:
-            if not group.matches(selected_set):
-                missing.extend(group.get_missing_components(selected_set))
+            if not group.matches(selected_set, selected_mods):
+                missing.extend(group.get_missing_components(selected_set, selected_mods))
         return missing
 
-    def get_matching(self, selected_set: set[ComponentReference]) -> list[ComponentReference]:
+    def get_matching(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
         """Get components that match."""
         matching = []
         for group in self.groups:
-            if group.matches(selected_set):
-                matching.extend(group.get_matched_components(selected_set))
+            if group.matches(selected_set, selected_mods):
+                matching.extend(group.get_matched_components(selected_set, selected_mods))
         return matching
 
 
-class TrivialCondition:
-    """Trivial condition evaluator (for optimization)."""
-
-    __slots__ = ("_result",)
-
-    def __init__(self, result: bool):
-        self._result = result
-
-    def is_satisfied(self, selected_set: set[ComponentReference]) -> bool:
-        return self._result
-
-    @staticmethod
-    def get_missing(selected_set: set[ComponentReference]) -> list[ComponentReference]:
-        return []
-
-    @staticmethod
-    def get_matching(selected_set: set[ComponentReference]) -> list[ComponentReference]:
-        return []
-
-
 # ===================================================================
 # Rule Manager
 # ===================================================================
@@ -506,6 +621,8 @@ class RuleManager(QObject):
     cache_building = Signal()  # Emitted when cache building starts
     cache_error = Signal(str)  # Emitted on error
 
+    SELECTION_CACHE_SIZE = 16  # Max remembered selections
+
     def __init__(
         self, mod_manager: ModManager, rules_dir: Path = RULES_DIR, cache_dir: Path = CACHE_DIR
     ) -> None:
@@ -530,12 +647,48 @@ class RuleManager(QObject):
 
         # Indexes
         self._indexes = IndexManager.get_indexes()
-        self._rules_by_component: dict[ComponentReference, set[Rule]] = defaultdict(set)
+        self._rules_by_component: dict[ComponentReference, tuple[Rule, ...]] = {}
+        # Same without order rules, for selection validation
+        self._selection_rules_by_component: dict[
+            ComponentReference, tuple[DependencyRule | IncompatibilityRule, ...]
+        ] = {}
+        # Dependency rules only, for requirement lookups
+        self._dependency_rules_by_component: dict[
+            ComponentReference, tuple[DependencyRule, ...]
+        ] = {}
+        self._rules_by_mod_source: dict[
+            str, tuple[DependencyRule | IncompatibilityRule, ...]
+        ] = {}
+        # Selection rules by every source and target reference as written (whole mods
+        # as MOD references), resolved or not, to find the rules a toggle can affect
+        self._selection_rules_by_reference: dict[
+            ComponentReference, tuple[DependencyRule | IncompatibilityRule, ...]
+        ] = {}
+        self._components_by_mod: dict[str, frozenset[ComponentReference]] = {}
         self._resolved_wildcards_cache: dict[
             int, tuple[frozenset[ComponentReference], frozenset[ComponentReference]]
         ] = {}
-
-        self._last_selection_hash: int | None = None
+        self._order_directions: dict[int, OrderDirection] = {}
+        # Selection check of each selection rule, bound to its prebuilt evaluators
+        self._selection_checkers: dict[int, SelectionChecker] = {}
+
+        # Selection checkers by exact rule class
+        self._checkers: dict[type[Rule], Callable[..., RuleViolation | None]] = {
+            DependencyRule: self._check_dependency,
+            IncompatibilityRule: self._check_incompatibility,
+        }
+
+        # Loaded rules per language, so switching back skips parsing and indexing
+        self._loaded_rules_by_language: dict[str, LoadedRules] = {}
+
+        # Last validated selection and its violations (incremental revalidation)
+        self._last_selection: frozenset[ComponentReference] | None = None
+        self._last_selection_violations: list[RuleViolation] = []
+        # Recently validated selections, most recent last (toggling back is a hit)
+        self._selection_cache: OrderedDict[
+            frozenset[ComponentReference], list[RuleViolation]
+        ] = OrderedDict()
+        self._requirements_cache: dict[tuple[str, str, bool], frozenset[tuple[str, str]]] = {}
 
         # Cache builder thread
         self.builder_thread: RuleCacheBuilderThread | None = None
@@ -570,6 +723,8 @@ class RuleManager(QObject):
     def _on_cache_build_finished(self, success: bool) -> None:
         """Called when cache building finishes."""
         if success:
+            # Cache files were regenerated: rules kept in memory are stale
+            self._loaded_rules_by_language.clear()
             if self.load_cache():
                 logger.info("Rule cache loaded successfully after build")
                 self.cache_ready.emit(True)
@@ -592,45 +747,54 @@ class RuleManager(QObject):
 
     def _should_rebuild_cache(self) -> bool:
         """Check if cache should be rebuilt."""
+        cache_names = [f"rules_{lang}.json" for lang, _ in SUPPORTED_LANGUAGES]
+        source_names = ["dependencies.json", "incompatibilities.json", "order.json"]
+
+        try:
+            cache_mtimes = self._scan_mtimes(self.cache_dir, cache_names)
+            source_mtimes = self._scan_mtimes(self.rules_dir, source_names)
+        except OSError as e:
+            logger.error(f"Error checking rule file timestamps: {e}")
+            return True
+
         for lang, _ in SUPPORTED_LANGUAGES:
-            cache_file = self.cache_dir / f"rules_{lang}.json"
-            if not cache_file.exists():
+            if f"rules_{lang}.json" not in cache_mtimes:
                 logger.info(f"Rule cache missing for {lang}")
                 return True
 
-        source_files = [
-            self.rules_dir / "dependencies.json",
-            self.rules_dir / "incompatibilities.json",
-            self.rules_dir / "order.json",
-        ]
-
-        existing_sources = [f for f in source_files if f.exists()]
-
-        if not existing_sources:
+        if not source_mtimes:
             logger.warning("No source rule files found")
             return False
 
-        try:
-            last_source_mod = max(f.stat().st_mtime for f in existing_sources)
-
-            # Compare with oldest cache
-            oldest_cache = min(
-                (self.cache_dir / f"rules_{lang}.json").stat().st_mtime
-                for lang, _ in SUPPORTED_LANGUAGES
-            )
-
-            if last_source_mod > oldest_cache:
-                logger.info("Source rule files newer than cache")
-                return True
-
-        except OSError as e:
-            logger.error(f"Error checking rule file timestamps: {e}")
+        # Compare with oldest cache
+        if max(source_mtimes.values()) > min(cache_mtimes.values()):
+            logger.info("Source rule files newer than cache")
             return True
 
         return False
 
+    @staticmethod
+    def _scan_mtimes(directory: Path, names: list[str]) -> dict[str, float]:
+        """Get modification times of the named files present in a directory."""
+        wanted = set(names)
+        try:
+            with os.scandir(directory) as entries:
+                return {
+                    entry.name: entry.stat().st_mtime
+                    for entry in entries
+                    if entry.name in wanted and entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+
     def load_cache(self) -> bool:
         """Load cached rules for current language."""
+        loaded = self._loaded_rules_by_language.get(self.current_language)
+        if loaded is not None:
+            self._restore_loaded_rules(loaded)
+            logger.info(f"Rules for {self.current_language} restored from memory")
+            return True
+
         cache_file = self.cache_dir / f"rules_{self.current_language}.json"
 
         if not cache_file.exists():
@@ -638,20 +802,29 @@ class RuleManager(QObject):
             return False
 
         try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Reset all rules
-            self._dependency_rules.clear()
-            self._incompatibility_rules.clear()
-            self._order_rules.clear()
-            self._all_rules.clear()
-            self._rules_by_component.clear()
+            data = json.loads(cache_file.read_bytes())
+
+            # Reset all rules (new containers: earlier ones may be kept per language)
+            self._dependency_rules = []
+            self._incompatibility_rules = []
+            self._order_rules = []
+            self._all_rules = []
+            self._rules_by_component = {}
+            self._selection_rules_by_component = {}
+            self._dependency_rules_by_component = {}
+            self._rules_by_mod_source = {}
+            self._selection_rules_by_reference = {}
+            self._resolved_wildcards_cache = {}
+            self._order_directions = {}
+            self._selection_checkers = {}
+            self._reset_selection_cache()
             self._validation_states.clear()
+            self._requirements_cache.clear()
 
-            self._load_rules_from_cache(data.get("dependencies", []), DependencyRule)
-            self._load_rules_from_cache(data.get("incompatibilities", []), IncompatibilityRule)
-            self._load_rules_from_cache(data.get("order", []), OrderRule)
+            self._load_rules_from_cache(data.pop("dependencies", []), DependencyRule)
+            self._load_rules_from_cache(data.pop("incompatibilities", []), IncompatibilityRule)
+            self._load_rules_from_cache(data.pop("order", []), OrderRule)
+            del data
 
             group_rules = sum(1 for rule in self._dependency_rules if rule.uses_groups())
 
@@ -666,6 +839,22 @@ class RuleManager(QObject):
 
             self._build_indexes()
 
+            self._loaded_rules_by_language[self.current_language] = LoadedRules(
+                dependency_rules=self._dependency_rules,
+                incompatibility_rules=self._incompatibility_rules,
+                order_rules=self._order_rules,
+                all_rules=self._all_rules,
+                rules_by_component=self._rules_by_component,
+                selection_rules_by_component=self._selection_rules_by_component,
+                dependency_rules_by_component=self._dependency_rules_by_component,
+                rules_by_mod_source=self._rules_by_mod_source,
+                selection_rules_by_reference=self._selection_rules_by_reference,
+                components_by_mod=self._components_by_mod,
+                resolved_wildcards=self._resolved_wildcards_cache,
+                order_directions=self._order_directions,
+                selection_checkers=self._selection_checkers,
+            )
+
             return True
 
         except json.JSONDecodeError as e:
@@ -675,6 +864,25 @@ class RuleManager(QObject):
             logger.exception(f"Error loading rule cache: {e}")
             return False
 
+    def _restore_loaded_rules(self, loaded: LoadedRules) -> None:
+        """Make previously loaded rules and indexes current."""
+        self._dependency_rules = loaded.dependency_rules
+        self._incompatibility_rules = loaded.incompatibility_rules
+        self._order_rules = loaded.order_rules
+        self._all_rules = loaded.all_rules
+        self._rules_by_component = loaded.rules_by_component
+        self._selection_rules_by_component = loaded.selection_rules_by_component
+        self._dependency_rules_by_component = loaded.dependency_rules_by_component
+        self._rules_by_mod_source = loaded.rules_by_mod_source
+        self._selection_rules_by_reference = loaded.selection_rules_by_reference
+        self._components_by_mod = loaded.components_by_mod
+        self._resolved_wildcards_cache = loaded.resolved_wildcards
+        self._order_directions = loaded.order_directions
+        self._selection_checkers = loaded.selection_checkers
+        self._reset_selection_cache()
+        self._validation_states.clear()
+        self._requirements_cache.clear()
+
     def reload_for_language(self, language: str) -> bool:
         """Reload cache for a new language."""
         if not any(lang == language for lang, _ in SUPPORTED_LANGUAGES):
@@ -688,7 +896,7 @@ class RuleManager(QObject):
         success = self.load_cache()
 
         if success:
-            self._last_selection_hash = None
+            self._reset_selection_cache()
             self._indexes.clear_selection_violations()
             self._indexes.clear_order_violations()
 
@@ -696,10 +904,10 @@ class RuleManager(QObject):
 
     def _load_rules_from_cache(self, rules_data: list, cls) -> None:
         """Load rules from cache data."""
-        loaded_count = 0
         error_count = 0
 
         # Determine target list
+        target_list: list[Any]
         if cls == DependencyRule:
             target_list = self._dependency_rules
         elif cls == IncompatibilityRule:
@@ -710,23 +918,33 @@ class RuleManager(QObject):
             logger.error(f"Unknown rule class: {cls}")
             return
 
-        for rule_data in rules_data:
-            try:
-                rule = cls.from_dict(rule_data)
-                target_list.append(rule)
-                self._all_rules.append(rule)
-                loaded_count += 1
-            except (ValueError, KeyError, TypeError) as e:
-                error_count += 1
-                logger.error(f"Failed to load rule '{rule_data}': {e}. Rule skipped.")
-            except Exception as e:
-                error_count += 1
-                logger.error(
-                    f"Unexpected error loading rule '{rule_data}': {e}. Rule skipped.",
-                    exc_info=True,
-                )
+        from_dict = cls.from_dict
 
-        logger.debug(f"{loaded_count} rules loaded from cache")
+        try:
+            # Cache entries are normally all valid: convert them in one pass
+            parsed: list[Any] = list(map(from_dict, rules_data))
+        except Exception:
+            # At least one is not: convert one by one to report and skip the bad ones
+            parsed = []
+            add_rule = parsed.append
+
+            for rule_data in rules_data:
+                try:
+                    add_rule(from_dict(rule_data))
+                except (ValueError, KeyError, TypeError) as e:
+                    error_count += 1
+                    logger.error(f"Failed to load rule '{rule_data}': {e}. Rule skipped.")
+                except Exception as e:
+                    error_count += 1
+                    logger.error(
+                        f"Unexpected error loading rule '{rule_data}': {e}. Rule skipped.",
+                        exc_info=True,
+                    )
+
+        target_list.extend(parsed)
+        self._all_rules.extend(parsed)
+
+        logger.debug(f"{len(parsed)} rules loaded from cache")
         if error_count > 0:
             logger.warning(f"Skipped {error_count} invalid {cls.__name__}(s)")
 
@@ -747,35 +965,94 @@ class RuleManager(QObject):
     @staticmethod
     def _resolve_refs_globally(
         refs: tuple[ComponentReference, ...],
-        by_mod: dict[str, set[ComponentReference]],
-    ) -> set[ComponentReference]:
+        by_mod: dict[str, frozenset[ComponentReference]],
+    ) -> frozenset[ComponentReference]:
         """Resolve references with all known components."""
-        result = set()
-
-        for ref in refs:
-            if ref.is_mod():
-                result.update(by_mod.get(ref.mod_id, set()))
-            else:
-                result.add(ref)
-
-        return result
+        return frozenset(
+            chain.from_iterable(
+                by_mod.get(ref.mod_id, ()) if ref.is_mod() else (ref,) for ref in refs
+            )
+        )
 
     def _build_indexes(self) -> None:
-        all_components, components_by_mod = self._get_all_known_components()
+        _, known_by_mod = self._get_all_known_components()
+        self._components_by_mod = {
+            mod_id: frozenset(references) for mod_id, references in known_by_mod.items()
+        }
+        components_by_mod = self._components_by_mod
+
+        rules_by_component: dict[ComponentReference, set[Rule]] = defaultdict(set)
+        rules_by_mod_source: dict[str, list[DependencyRule | IncompatibilityRule]] = (
+            defaultdict(list)
+        )
+        selection_rules_by_reference: dict[
+            ComponentReference, list[DependencyRule | IncompatibilityRule]
+        ] = defaultdict(list)
+
+        order_directions = self._order_directions
+        selection_checkers = self._selection_checkers
+        resolved_wildcards = self._resolved_wildcards_cache
+        checkers = self._checkers
+        create_target_evaluator = self._create_target_evaluator
+        resolve = self._resolve_refs_globally
 
         for rule in self._all_rules:
             rule_id = id(rule)
 
-            sources = self._resolve_refs_globally(rule.sources, components_by_mod)
-            targets = self._resolve_refs_globally(rule.targets, components_by_mod)
+            # Rules checked by order validation, with the direction they impose
+            if isinstance(rule, OrderRule):
+                order_directions[rule_id] = rule.order_direction
+            elif isinstance(rule, DependencyRule) and rule.implicit_order:
+                order_directions[rule_id] = OrderDirection.AFTER
+
+            if isinstance(rule, (DependencyRule, IncompatibilityRule)):
+                selection_checkers[rule_id] = partial(
+                    checkers[type(rule)],
+                    rule,
+                    GroupCondition(rule.source_groups) if rule.source_groups else None,
+                    create_target_evaluator(rule),
+                )
+
+                # Selection rules whose source is a whole mod, by source mod id
+                for mod_id in dict.fromkeys(src.mod_id for src in rule.sources if src.is_mod()):
+                    rules_by_mod_source[mod_id].append(rule)
+                for reference in dict.fromkeys(chain(rule.sources, rule.targets)):
+                    selection_rules_by_reference[reference].append(rule)
+
+            sources = resolve(rule.sources, components_by_mod)
+            targets = resolve(rule.targets, components_by_mod)
 
             if not sources or not targets:
                 continue
 
-            self._resolved_wildcards_cache[rule_id] = (frozenset(sources), frozenset(targets))
-
-            for comp in sources | targets:
-                self._rules_by_component[comp].add(rule)
+            resolved_wildcards[rule_id] = (sources, targets)
+
+            # Sets per component: a rule listed on both sides is indexed once
+            for comp in chain(sources, targets):
+                rules_by_component[comp].add(rule)
+
+        self._rules_by_component = {
+            comp: tuple(rules) for comp, rules in rules_by_component.items()
+        }
+        self._rules_by_mod_source = {
+            mod_id: tuple(rules) for mod_id, rules in rules_by_mod_source.items()
+        }
+        self._selection_rules_by_reference = {
+            reference: tuple(rules) for reference, rules in selection_rules_by_reference.items()
+        }
+        self._selection_rules_by_component = {}
+        self._dependency_rules_by_component = {}
+        for comp, rules in self._rules_by_component.items():
+            selection_rules = tuple(
+                rule
+                for rule in rules
+                if isinstance(rule, (DependencyRule, IncompatibilityRule))
+            )
+            if selection_rules:
+                self._selection_rules_by_component[comp] = selection_rules
+            dependency_rules = tuple(rule for rule in rules if isinstance(rule, DependencyRule))
+            if dependency_rules:
+                self._dependency_rules_by_component[comp] = dependency_rules
 
     # ========================================
     # SELECTION VALIDATION
@@ -786,128 +1063,188 @@ class RuleManager(QObject):
     ) -> list[RuleViolation]:
         """Validate component selection against dependency and incompatibility rules."""
         references = [reference for reference in selected_components if not reference.is_mod()]
-        selection_hash = hash(frozenset(references))
-        if self._last_selection_hash == selection_hash:
+        selection = frozenset(references)
+        if self._last_selection == selection:
             return self._get_all_cached_selection_violations()
 
+        cached = self._selection_cache.get(selection)
+        if cached is not None:
+            # Seen recently: restore its violations without revalidating
+            self._selection_cache.move_to_end(selection)
+            self._indexes.clear_selection_violations()
+            for cached_violation in cached:
+                self._indexes.add_selection_violation(cached_violation)
+            self._last_selection = selection
+            self._last_selection_violations = cached
+            return list(cached)
+
+        previous_selection = self._last_selection
+        previous_violations = self._last_selection_violations
+
         self._indexes.clear_selection_violations()
-        self._last_selection_hash = selection_hash
+        self._last_selection = selection
 
         violations: list[RuleViolation] = []
-        selected_set = set(references)
+        self._last_selection_violations = violations
+        self._selection_cache[selection] = violations
+        if len(self._selection_cache) > self.SELECTION_CACHE_SIZE:
+            self._selection_cache.popitem(last=False)
+        selected_set = selection
+
+        # The same rule can be reached from several selected components (and from
+        # the whole-mod pass below) and yield identical violations: keep one of each
+        seen_violations: set[tuple[int, tuple[ComponentReference, ...]]] = set()
+
+        def record_violation(violation: RuleViolation) -> None:
+            key = (id(violation.rule), violation.affected_components)
+            if key in seen_violations:
+                return
+            seen_violations.add(key)
+            violations.append(violation)
+            self._indexes.add_selection_violation(violation)
+
+        get_rules = self._selection_rules_by_component.get  # Order rules validated separately
+        get_mod_source_rules = self._rules_by_mod_source.get
+        resolved_wildcards = self._resolved_wildcards_cache
+        get_resolved = resolved_wildcards.get
+        for_mod = ComponentReference.for_mod
+        selection_checkers = self._selection_checkers
+
+        # Rules with a whole-mod source: one check per rule, using the lowest selected
+        # component of its first selected source mod (stable while that mod is unchanged)
+        selected_by_mod: dict[str, ComponentReference] = {}
+        for reference in selected_set:
+            current = selected_by_mod.get(reference.mod_id)
+            if current is None or reference < current:
+                selected_by_mod[reference.mod_id] = reference
+        selected_mods = frozenset(selected_by_mod)
+
+        changed = selection ^ previous_selection if previous_selection is not None else None
+
+        if changed is not None and len(changed) < len(selection):
+            # A few components were toggled: a rule can change outcome only if it
+            # involves one of them, other violations still hold. Rules are looked up
+            # as written, since resolved sides miss components outside the mod catalog
+            get_affected_rules = self._selection_rules_by_reference.get
+            changed_rules = dict.fromkeys(
+                chain.from_iterable(
+                    get_affected_rules(reference, ())
+                    for reference in chain(
+                        changed, {for_mod(reference.mod_id) for reference in changed}
+                    )
+                )
+            )
 
-        for reference in references:
-            rules = list(self._rules_by_component.get(reference, []))
+            for previous in previous_violations:
+                if previous.rule not in changed_rules:
+                    record_violation(previous)
 
-            wildcard_ref = ComponentReference(reference.mod_id, "*")
-            wildcard_rules = self._rules_by_component.get(wildcard_ref, [])
-            rules.extend(wildcard_rules)
+            for rule in changed_rules:
+                resolved = get_resolved(id(rule))
+                if resolved is None:
+                    continue
 
-            for rule in rules:
-                if rule.rule_type == RuleType.ORDER:
-                    continue  # Order rules validated separately
+                # Without source groups, only selected sources can trigger the rule
+                candidates = resolved[0] | resolved[1] if rule.source_groups else resolved[0]
+                for reference in candidates & selected_set:
+                    violation = selection_checkers[id(rule)](
+                        reference, selected_set, selected_mods
+                    )
+                    if violation:
+                        record_violation(violation)
+
+            mod_source_rules = [
+                rule
+                for mod_id in selected_by_mod
+                for rule in get_mod_source_rules(mod_id, ())
+                if rule in changed_rules
+            ]
+        else:
+            for reference in references:
+                rules = get_rules(reference)
+                wildcard_rules = get_rules(for_mod(reference.mod_id))
 
-                violation = self._check_rule(rule, reference, selected_set)
-                if violation:
-                    violations.append(violation)
-                    self._indexes.add_selection_violation(violation)
+                if not rules and not wildcard_rules:
+                    continue
 
-        for rule in self._all_rules:
-            if rule.rule_type == RuleType.ORDER:
-                continue
+                for rule in chain(rules or (), wildcard_rules or ()):
+                    # Rule reached through its targets: cannot fire for this reference
+                    if (
+                        not rule.source_groups
+                        and reference not in resolved_wildcards[id(rule)][0]
+                    ):
+                        continue
+
+                    violation = selection_checkers[id(rule)](
+                        reference, selected_set, selected_mods
+                    )
+                    if violation:
+                        record_violation(violation)
+
+            mod_source_rules = list(
+                chain.from_iterable(
+                    get_mod_source_rules(mod_id, ()) for mod_id in selected_by_mod
+                )
+            )
 
+        for rule in dict.fromkeys(mod_source_rules):
             for source in rule.sources:
-                if source.is_mod() and self._matches_reference(source, selected_set):
-                    # Find a matching component to use as source_ref
-                    for reference in selected_set:
-                        if reference.mod_id == source.mod_id:
-                            violation = self._check_rule(rule, reference, selected_set)
-                            if violation:
-                                violations.append(violation)
-                                self._indexes.add_selection_violation(violation)
-                            break
+                if source.is_mod() and source.mod_id in selected_by_mod:
+                    violation = selection_checkers[id(rule)](
+                        selected_by_mod[source.mod_id], selected_set, selected_mods
+                    )
+                    if violation:
+                        record_violation(violation)
                     break
 
-        return violations
+        # Copy: the list is kept for incremental and cached revalidation
+        return list(violations)
+
+    def _reset_selection_cache(self) -> None:
+        """Forget validated selections (rules changed)."""
+        self._last_selection = None
+        self._last_selection_violations = []
+        self._selection_cache.clear()
 
     def _get_all_cached_selection_violations(self) -> list[RuleViolation]:
         """Extract all violations from cache as flat list."""
-        all_violations = []
-        seen_violations = set()
-
-        for violations in self._indexes.selection_violation_index.values():
-            for violation in violations:
-                # Use id() to avoid duplicates (same violation object)
-                if id(violation) not in seen_violations:
-                    all_violations.append(violation)
-                    seen_violations.add(id(violation))
-
-        return all_violations
-
-    def _check_rule(
-        self, rule: Rule, source_ref: ComponentReference, selected_set: set[ComponentReference]
-    ) -> RuleViolation | None:
-        if isinstance(rule, DependencyRule):
-            return self._check_dependency(rule, source_ref, selected_set)
-        if isinstance(rule, IncompatibilityRule):
-            return self._check_incompatibility(rule, source_ref, selected_set)
-        return None
-
-    @staticmethod
-    def _matches_reference(
-        reference: ComponentReference, selected_set: set[ComponentReference]
-    ) -> bool:
-        """Check if a reference matches any selected component."""
-        if reference.is_mod():
-            return any(selected.mod_id == reference.mod_id for selected in selected_set)
-        return reference in selected_set
+        return list(self._indexes.selection_violations)
 
     def _check_dependency(
         self,
         rule: DependencyRule,
+        source_evaluator: GroupCondition | None,
+        target_evaluator: ConditionEvaluator,
         source_ref: ComponentReference,
-        selected_set: set[ComponentReference],
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> RuleViolation | None:
         """Check DependencyRule: supports ALL and ANY modes."""
-        source_evaluator = self._create_source_evaluator(rule, source_ref)
-
-        if not source_evaluator.is_satisfied(selected_set):
+        if not self._is_source_satisfied(
+            rule, source_evaluator, source_ref, selected_set, selected_mods
+        ):
             return None
 
-        target_evaluator = self._create_target_evaluator(rule)
-
-        if target_evaluator.is_satisfied(selected_set):
+        if target_evaluator.is_satisfied(selected_set, selected_mods):
             return None
 
-        missing = target_evaluator.get_missing(selected_set)
+        missing = target_evaluator.get_missing(selected_set, selected_mods)
         affected = (source_ref,) + tuple(missing)
 
         return RuleViolation(rule=rule, affected_components=affected)
 
-    def _create_source_evaluator(
-        self, rule: DependencyRule | IncompatibilityRule, source_ref: ComponentReference
-    ) -> ConditionEvaluator:
-        """Factory method: create appropriate source evaluator."""
-        if rule.source_groups:
-            return GroupCondition(rule.source_groups)
-
-        for rule_source in rule.sources:
-            if self._references_match_for_source(source_ref, rule_source):
-                return TrivialCondition(True)
-        return TrivialCondition(False)
-
     @staticmethod
-    def _references_match_for_source(
-        selected_ref: ComponentReference, rule_source: ComponentReference
+    def _is_source_satisfied(
+        rule: DependencyRule | IncompatibilityRule,
+        source_evaluator: GroupCondition | None,
+        source_ref: ComponentReference,
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> bool:
-        """Check if a selected component matches a rule source (handles wildcards)."""
-        if rule_source.mod_id != selected_ref.mod_id:
-            return False
-
-        if rule_source.is_mod():
-            return True
-
-        return rule_source.comp_key == selected_ref.comp_key
+        """Check whether the rule applies: its source groups, or the reference is a source."""
+        if source_evaluator is not None:
+            return source_evaluator.is_satisfied(selected_set, selected_mods)
+        return rule.has_source(source_ref)
 
     def _create_target_evaluator(
         self, rule: DependencyRule | IncompatibilityRule
@@ -921,25 +1258,32 @@ class RuleManager(QObject):
             mode=rule.dependency_mode
             if isinstance(rule, DependencyRule)
             else DependencyMode.ANY,
-            matcher=self._matches_reference,
         )
 
     def _check_incompatibility(
         self,
         rule: IncompatibilityRule,
+        source_evaluator: GroupCondition | None,
+        target_evaluator: ConditionEvaluator,
         source_ref: ComponentReference,
-        selected_set: set[ComponentReference],
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> RuleViolation | None:
         """Check incompatibility: collect conflicting selected components."""
-        source_evaluator = self._create_source_evaluator(rule, source_ref)
-        if not source_evaluator.is_satisfied(selected_set):
+        if not self._is_source_satisfied(
+            rule, source_evaluator, source_ref, selected_set, selected_mods
+        ):
             return None
 
-        target_evaluator = self._create_target_evaluator(rule)
-        if not target_evaluator.is_satisfied(selected_set):
-            return None
+        if rule.target_groups:
+            if not target_evaluator.is_satisfied(selected_set, selected_mods):
+                return None
+            conflicts = target_evaluator.get_matching(selected_set, selected_mods)
+        else:
+            conflicts = rule.get_selected_targets(selected_set, selected_mods)
+            if not conflicts:
+                return None
 
-        conflicts = target_evaluator.get_matching(selected_set)
         affected = (source_ref,) + tuple(conflicts)
         return RuleViolation(rule=rule, affected_components=affected)
 
@@ -963,13 +1307,18 @@ class RuleManager(QObject):
         state = self._validation_states.get(state_key)
 
         if not state or not moved_components:
+            if state:
+                self._discard_order_violations(
+                    [v for violations in state.violations_by_rule.values() for v in violations]
+                )
+
             state = ValidationState()
             self._validation_states[state_key] = state
             state.update_positions(install_order)
 
             affected_rules = set()
             for comp in install_order:
-                affected_rules.update(self._rules_by_component.get(comp, set()))
+                affected_rules.update(self._rules_by_component.get(comp, ()))
 
             logger.debug(
                 f"Full validation seq {state_key}: {len(install_order)} components, {len(affected_rules)} rules"
@@ -980,77 +1329,92 @@ class RuleManager(QObject):
 
             affected_rules = set()
             for comp in moved_components:
-                affected_rules.update(self._rules_by_component.get(comp, set()))
+                affected_rules.update(self._rules_by_component.get(comp, ()))
 
             logger.debug(
                 f"Incremental seq {state_key}: {len(moved_components)} moved, {len(affected_rules)} rules affected"
             )
 
         # Remove old violations from affected rules
+        old_violations = []
         for rule in affected_rules:
-            rule_id = id(rule)
-            old_violations = state.violations_by_rule.pop(rule_id, [])
+            old_violations.extend(state.violations_by_rule.pop(id(rule), []))
+        self._discard_order_violations(old_violations)
 
-            for old_violation in old_violations:
-                for comp in old_violation.affected_components:
-                    comp_violations = self._indexes.order_violation_index.get(comp)
-                    if comp_violations and old_violation in comp_violations:
-                        comp_violations.remove(old_violation)
+        get_resolved = self._resolved_wildcards_cache.get
+        get_direction = self._order_directions.get
+        active = state.active_components
+        position_of = state.positions.__getitem__
+        violations_by_rule = state.violations_by_rule
+        add_violation = self._indexes.add_order_violation
 
         for rule in affected_rules:
             rule_id = id(rule)
 
-            resolved = self._resolved_wildcards_cache.get(rule_id)
+            direction = get_direction(rule_id)
+            if direction is None:
+                continue
+
+            resolved = get_resolved(rule_id)
             if not resolved:
                 continue
 
             all_sources, all_targets = resolved
 
-            active = state.active_components
             sources = all_sources & active
             targets = all_targets & active
 
             if not sources or not targets:
                 continue
 
-            if isinstance(rule, OrderRule):
-                direction = rule.order_direction
-            elif isinstance(rule, DependencyRule) and rule.implicit_order:
-                direction = OrderDirection.AFTER
-            else:
+            # sources/targets are already restricted to the active (positioned) components
+            sources_with_pos = [(src, position_of(src)) for src in sources]
+            targets_with_pos = [(tgt, position_of(tgt)) for tgt in targets]
+
+            if direction == OrderDirection.BEFORE:
+                if max(pos for _, pos in sources_with_pos) < min(
+                    pos for _, pos in targets_with_pos
+                ):
+                    continue
+            elif min(pos for _, pos in sources_with_pos) > max(
+                pos for _, pos in targets_with_pos
+            ):
                 continue
 
-            positions = state.positions
-            sources_with_pos = [(src, positions[src]) for src in sources if src in positions]
-            targets_with_pos = [(tgt, positions[tgt]) for tgt in targets if tgt in positions]
+            # Sort targets by position so each source only visits the targets it violates:
+            # the ones placed before it (BEFORE) or after it (AFTER), found by bisection
+            targets_with_pos.sort(key=itemgetter(1))
+            target_positions = [pos for _, pos in targets_with_pos]
 
             for src, src_pos in sources_with_pos:
-                for tgt, tgt_pos in targets_with_pos:
-                    if src == tgt:
-                        continue
+                if direction == OrderDirection.BEFORE:
+                    violating = targets_with_pos[: bisect_left(target_positions, src_pos)]
+                else:
+                    violating = targets_with_pos[bisect_right(target_positions, src_pos) :]
 
-                    if self._check_order_violation(src_pos, tgt_pos, direction):
-                        violation = RuleViolation(
-                            rule=rule,
-                            affected_components=(src, tgt),
-                        )
+                # A component never violates itself: its own position is excluded by bisection
+                for tgt, _ in violating:
+                    violation = RuleViolation(
+                        rule=rule,
+                        affected_components=(src, tgt),
+                    )
 
-                        state.violations_by_rule[rule_id].append(violation)
-                        self._indexes.add_order_violation(violation)
+                    violations_by_rule[rule_id].append(violation)
+                    add_violation(violation)
 
         return [v for violations in state.violations_by_rule.values() for v in violations]
 
-    @staticmethod
-    def _check_order_violation(
-        source_pos: int,
-        target_pos: int,
-        direction: OrderDirection,
-    ) -> bool:
-        """Check if there is an order violation."""
-        if direction == OrderDirection.BEFORE:
-            return source_pos > target_pos
-        else:  # AFTER
-            return source_pos < target_pos
+    def _discard_order_violations(self, violations: list[RuleViolation]) -> None:
+        """Remove violations from the order index, one filtering pass per component."""
+        stale_ids_by_comp: dict[ComponentReference, set[int]] = defaultdict(set)
+        for violation in violations:
+            for comp in violation.affected_components:
+                stale_ids_by_comp[comp].add(id(violation))
+
+        for comp, stale_ids in stale_ids_by_comp.items():
+            comp_violations = self._indexes.order_violation_index.get(comp)
+            if comp_violations:
+                comp_violations[:] = [v for v in comp_violations if id(v) not in stale_ids]
 
     def _clear_game_states(self, game_id: str | None) -> None:
         """Clean up validation states for a specific game."""
@@ -1067,9 +1431,9 @@ class RuleManager(QObject):
     # PUBLIC API
     # ========================================
 
-    def get_rules_for_component(self, reference: ComponentReference) -> list[Rule]:
+    def get_rules_for_component(self, reference: ComponentReference) -> tuple[Rule, ...]:
         """Get all rules where the component is a source."""
-        return self._rules_by_component.get(reference, [])
+        return self._rules_by_component.get(reference, ())
 
     def get_selection_violations(self, reference: ComponentReference) -> list[RuleViolation]:
         """Get cached selection violations for a specific component."""
@@ -1085,37 +1449,50 @@ class RuleManager(QObject):
 
     def get_requirements(
         self, mod_id: str, comp_key: str, recursive: bool = False
-    ) -> set[tuple[str, str]]:
-        """Get all components required by a specific component."""
-        requirements: set[tuple[str, str]] = set()
-        visiting: set[tuple[str, str]] = set()
+    ) -> frozenset[tuple[str, str]]:
+        """Get all components required by a specific component.
 
-        def _collect_requirements(mod_id: str, comp_key: str):
-            current = (mod_id, comp_key)
+        Results are cached until rules are reloaded.
+        """
+        cache_key = (mod_id.lower(), comp_key, recursive)
+        cached = self._requirements_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-            if current in visiting:
-                return
+        requirements: set[tuple[str, str]] = set()
+        visited: set[ComponentReference] = set()
+
+        requirements_cache = self._requirements_cache
+        get_dependency_rules = self._dependency_rules_by_component.get
+        components_by_mod = self._components_by_mod
+
+        # Iterative walk over references: no frame per visit, no recursion limit on
+        # deep chains, and no "mod:key" string to build and parse
+        pending = [ComponentReference.for_component(mod_id, comp_key)]
+        while pending:
+            reference = pending.pop()
+            if reference in visited:
+                continue
 
-            visiting.add(current)
-            reference = ComponentReference.from_string(f"{mod_id}:{comp_key}")
-            rules = self.get_rules_for_component(reference)
+            visited.add(reference)
 
-            for rule in rules:
-                if not isinstance(rule, DependencyRule):
+            if recursive:
+                # Complete closure already computed for this component: reuse it
+                known = requirements_cache.get((reference.mod_id, reference.comp_key, True))
+                if known is not None:
+                    requirements.update(known)
                     continue
 
+            for rule in get_dependency_rules(reference, ()):
                 for target in rule.targets:
                     requirements.add((target.mod_id, target.comp_key))
 
                     if recursive:
                         if target.is_mod():
-                            known_comps = self._mod_manager.get_mod_by_id(
-                                target.mod_id
-                            ).get_component_refs()
-                            for comp in known_comps:
-                                _collect_requirements(target.mod_id, comp)
+                            pending.extend(components_by_mod.get(target.mod_id, ()))
                         else:
-                            _collect_requirements(target.mod_id, target.comp_key)
+                            pending.append(target)
 
-        _collect_requirements(mod_id, comp_key)
-        return requirements
+        result = frozenset(requirements)
+        self._requirements_cache[cache_key] = result
+        return result
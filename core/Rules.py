@@ -47,41 +47,63 @@ class ComponentGroup:
     components: tuple[ComponentReference, ...]
     operator: DependencyMode = DependencyMode.ANY
 
-    def matches(self, selected_set: set[ComponentReference]) -> bool:
+    def matches(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> bool:
         """Check if this group is satisfied by the selection."""
         if self.operator == DependencyMode.ANY:
             # At least one component must be selected
-            return any(self._matches_reference(comp, selected_set) for comp in self.components)
+            return any(
+                self.matches_reference(comp, selected_set, selected_mods)
+                for comp in self.components
+            )
         else:  # ALL
             # All components must be selected
-            return all(self._matches_reference(comp, selected_set) for comp in self.components)
+            return all(
+                self.matches_reference(comp, selected_set, selected_mods)
+                for comp in self.components
+            )
 
     def get_matched_components(
-        self, selected_set: set[ComponentReference]
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
     ) -> list[ComponentReference]:
         """Get components from this group that are selected."""
-        return [comp for comp in self.components if self._matches_reference(comp, selected_set)]
+        return [
+            comp
+            for comp in self.components
+            if self.matches_reference(comp, selected_set, selected_mods)
+        ]
 
     def get_missing_components(
-        self, selected_set: set[ComponentReference]
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
     ) -> list[ComponentReference]:
         """Get components from this group that are NOT selected."""
         return [
-            comp for comp in self.components if not self._matches_reference(comp, selected_set)
+            comp
+            for comp in self.components
+            if not self.matches_reference(comp, selected_set, selected_mods)
         ]
 
     @staticmethod
-    def _matches_reference(
-        reference: ComponentReference, selected_set: set[ComponentReference]
+    def matches_reference(
+        reference: ComponentReference,
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> bool:
-        """Check if a reference matches any selected component."""
+        """Check if a reference matches the selection (MOD references match any component)."""
         if reference.is_mod():
-            return any(selected.mod_id == reference.mod_id for selected in selected_set)
+            return reference.mod_id in selected_mods
         return reference in selected_set
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Rule:
+    """Base rule.
+
+    Rules compare and hash by identity: each one is loaded once per cache and
+    indexes already key on id(rule), so hashing every field is wasted work.
+    """
+
     rule_type: RuleType
     severity: RuleSeverity
     sources: tuple[ComponentReference, ...]
@@ -89,6 +111,54 @@ class Rule:
     description: str = ""
     source_url: str | None = None
 
+    # Membership views of sources/targets, computed once at construction
+    _source_set: frozenset[ComponentReference] = field(init=False, repr=False, compare=False)
+    _target_set: frozenset[ComponentReference] = field(init=False, repr=False, compare=False)
+    _target_mod_ids: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_source_set", frozenset(self.sources))
+        object.__setattr__(self, "_target_set", frozenset(self.targets))
+        object.__setattr__(
+            self,
+            "_target_mod_ids",
+            frozenset(ref.mod_id for ref in self.targets if ref.is_mod()),
+        )
+
+    def has_source(self, reference: ComponentReference) -> bool:
+        """Check if reference matches a rule source (handles MOD references)."""
+        return self._side_contains(self._source_set, reference)
+
+    def has_target(self, reference: ComponentReference) -> bool:
+        """Check if reference matches a rule target (handles MOD references)."""
+        return self._side_contains(self._target_set, reference)
+
+    def get_selected_targets(
+        self, selected_set: frozenset[ComponentReference], selected_mods: frozenset[str]
+    ) -> list[ComponentReference]:
+        """Get targets matched by the selection, in rule order."""
+        if self._target_set.isdisjoint(selected_set) and self._target_mod_ids.isdisjoint(
+            selected_mods
+        ):
+            return []
+
+        if not self._target_mod_ids:
+            return [target for target in self.targets if target in selected_set]
+
+        return [
+            target
+            for target in self.targets
+            if ComponentGroup.matches_reference(target, selected_set, selected_mods)
+        ]
+
+    @staticmethod
+    def _side_contains(
+        side: frozenset[ComponentReference], reference: ComponentReference
+    ) -> bool:
+        if reference.is_mod():
+            return any(ref.mod_id == reference.mod_id for ref in side)
+        return reference in side or ComponentReference.for_mod(reference.mod_id) in side
+
     @staticmethod
     def _parse_component_refs(data: Any) -> tuple[ComponentReference, ...]:
         if not isinstance(data, list):
@@ -146,7 +216,7 @@ class Rule:
         return cls._parse_component_refs(std), None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DependencyRule(Rule):
     dependency_mode: DependencyMode = DependencyMode.ANY
     implicit_order: bool = True
@@ -175,7 +245,7 @@ class DependencyRule(Rule):
         return bool(self.source_groups or self.target_groups)
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class IncompatibilityRule(Rule):
     source_groups: tuple[ComponentGroup, ...] | None = None
     target_groups: tuple[ComponentGroup, ...] | None = None
@@ -200,7 +270,7 @@ class IncompatibilityRule(Rule):
         return bool(self.source_groups or self.target_groups)
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class OrderRule(Rule):
     """Explicit order rule with direction."""
 
@@ -251,10 +321,15 @@ class RuleViolation:
             Formatted message string
         """
 
+        selected = frozenset(selected_set)
+        selected_mods = frozenset(reference.mod_id for reference in selected)
+
         if self.rule.rule_type == RuleType.DEPENDENCY:
-            message = self._format_dependency_message(for_reference, selected_set)
+            message = self._format_dependency_message(for_reference, selected, selected_mods)
         elif self.rule.rule_type == RuleType.INCOMPATIBILITY:
-            message = self._format_incompatibility_message(for_reference, selected_set)
+            message = self._format_incompatibility_message(
+                for_reference, selected, selected_mods
+            )
         else:
             message = "Unknown violation"
 
@@ -323,7 +398,6 @@ class RuleViolation:
 
         is_source = self._references_match(for_reference, self.affected_components[0])
         direction = cast(OrderRule, self.rule).order_direction
-        other_side = self.rule.targets if is_source else self.rule.sources
         positions = {ref: i for i, ref in enumerate(current_order)}
 
         def is_violation(other_pos: int) -> bool:
@@ -335,7 +409,7 @@ class RuleViolation:
             ref
             for ref in current_order
             if ref != for_reference
-            and any(self._references_match(ref, rule_ref) for rule_ref in other_side)
+            and (self.rule.has_target(ref) if is_source else self.rule.has_source(ref))
             and is_violation(positions[ref])
         ]
 
@@ -366,7 +440,7 @@ class RuleViolation:
 
         Dependencies imply: targets (dependencies) must be BEFORE sources (dependents)
         """
-        is_source = self._reference_in_list(for_reference, list(self.rule.sources))
+        is_source = self.rule.has_source(for_reference)
 
         constraint_key = "after" if is_source else "before"
         other_refs = self.rule.targets if is_source else self.rule.sources
@@ -382,15 +456,18 @@ class RuleViolation:
         return tr(f"rule.message_order_{constraint_key}", components=violating_names)
 
     def _format_dependency_message(
-        self, for_reference: ComponentReference, selected_set: set[ComponentReference]
+        self,
+        for_reference: ComponentReference,
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> str:
         """Format dependency violation message with current selection state."""
-        is_source = self._reference_in_list(for_reference, list(self.rule.sources))
+        is_source = self.rule.has_source(for_reference)
         missing: list[ComponentReference] = []
 
         if is_source:
             for target in self.rule.targets:
-                if not self._matches_reference(target, selected_set):
+                if not ComponentGroup.matches_reference(target, selected_set, selected_mods):
                     missing.append(target)
             if missing:
                 missing_str = ", ".join(str(t) for t in missing)
@@ -399,22 +476,29 @@ class RuleViolation:
                 return tr("rule.message_dependency_all_satisfied")
         else:
             for source in self.rule.sources:
-                if self._matches_reference(source, selected_set):
+                if ComponentGroup.matches_reference(source, selected_set, selected_mods):
                     missing.append(source)
             sources_str = ", ".join(str(s) for s in missing)
             return tr("rule.message_dependency_required_by", sources=sources_str)
 
     def _format_incompatibility_message(
-        self, for_reference: ComponentReference, selected_set: set[ComponentReference]
+        self,
+        for_reference: ComponentReference,
+        selected_set: frozenset[ComponentReference],
+        selected_mods: frozenset[str],
     ) -> str:
         """Format incompatibility violation message with current selection state."""
-        if self._reference_in_list(for_reference, list(self.rule.sources)):
+        if self.rule.has_source(for_reference):
             conflicts = [
-                ref for ref in self.rule.targets if self._matches_reference(ref, selected_set)
+                ref
+                for ref in self.rule.targets
+                if ComponentGroup.matches_reference(ref, selected_set, selected_mods)
             ]
         else:
             conflicts = [
-                ref for ref in self.rule.sources if self._matches_reference(ref, selected_set)
+                ref
+                for ref in self.rule.sources
+                if ComponentGroup.matches_reference(ref, selected_set, selected_mods)
             ]
 
         if not conflicts:
@@ -423,28 +507,6 @@ class RuleViolation:
         conflict_names = ", ".join(str(ref) for ref in conflicts)
         return tr("rule.message_incompatibility", conflict_names=conflict_names)
 
-    @staticmethod
-    def _matches_reference(
-        reference: ComponentReference, selected_set: set[ComponentReference]
-    ) -> bool:
-        """Check if a reference matches any selected component.
-
-        Duplicates RuleManager logic for consistency.
-        """
-        if reference.is_mod():
-            return any(selected.mod_id == reference.mod_id for selected in selected_set)
-
-        return reference in selected_set
-
-    def _reference_in_list(
-        self, reference: ComponentReference, ref_list: list[ComponentReference]
-    ) -> bool:
-        """Check if reference matches any reference in list (handles MOD references)."""
-        for ref in ref_list:
-            if self._references_match(reference, ref):
-                return True
-        return False
-
     @staticmethod
     def _references_match(ref1: ComponentReference, ref2: ComponentReference) -> bool:
         """Check if two references match (handles MOD references)."""
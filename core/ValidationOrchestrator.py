@@ -60,19 +60,11 @@ class ValidationOrchestrator:
 
     def has_errors(self) -> bool:
         """Check if any errors exist."""
-        return any(
-            violation.is_error
-            for violations in self._indexes.selection_violation_index.values()
-            for violation in violations
-        )
+        return any(violation.is_error for violation in self._indexes.selection_violations)
 
     def has_warnings(self) -> bool:
         """Check if any warnings exist."""
-        return any(
-            violation.is_warning
-            for violations in self._indexes.selection_violation_index.values()
-            for violation in violations
-        )
+        return any(violation.is_warning for violation in self._indexes.selection_violations)
 
     def get_violations_for_reference(
         self, reference: ComponentReference
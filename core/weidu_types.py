@@ -65,7 +65,7 @@ class ComponentInfo:
     component: Component | None
     tp2_name: str
     sequence_idx: int
-    requirements: set[tuple[str, str]] = ()
+    requirements: frozenset[tuple[str, str]] = frozenset()
     subcomponent_answers: list[str] = None
     extra_args: list[str] = None
 
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core.ComponentReference import ComponentReference
+from core.RuleManager import RuleManager
+
+
+class _StubMod:
+    def __init__(self, *refs: str) -> None:
+        self._refs = refs
+
+    def get_component_refs(self) -> tuple[str, ...]:
+        return self._refs
+
+
+class _StubModManager:
+    """Mod catalog without 'ghost': its components are outside the catalog."""
+
+    def get_all_mods(self) -> dict[str, _StubMod]:
+        return {
+            "alpha": _StubMod("alpha:1", "alpha:2"),
+            "beta": _StubMod("beta:1", "beta:2"),
+        }
+
+
+def _load_rule_manager(cache_dir: Path) -> RuleManager:
+    mod_manager: Any = _StubModManager()
+    manager = RuleManager(mod_manager, rules_dir=cache_dir, cache_dir=cache_dir)
+    rules = {
+        "dependencies": [
+            {"source": ["alpha:1"], "target": ["ghost:*"], "implicit_order": False},
+        ],
+        "incompatibilities": [
+            {"source": ["ghost:*"], "target": ["beta:*"]},
+            {"source_groups": [["alpha:1"], ["beta:*"]], "target": ["ghost:*"]},
+        ],
+        "order": [],
+    }
+    (cache_dir / f"rules_{manager.current_language}.json").write_text(json.dumps(rules))
+    assert manager.load_cache()
+    return manager
+
+
+@pytest.fixture
+def rule_manager(tmp_path: Path) -> RuleManager:
+    return _load_rule_manager(tmp_path)
+
+
+def _refs(*names: str) -> list[ComponentReference]:
+    return [ComponentReference.from_string(name) for name in names]
+
+
+def _violation_keys(violations) -> list[tuple[str, tuple[str, ...]]]:
+    return sorted(
+        (v.rule.description or str(v.rule.sources), tuple(map(str, v.affected_components)))
+        for v in violations
+    )
+
+
+@pytest.mark.parametrize(
+    "steps",
+    [
+        # Target-side toggles of a rule whose source mod is outside the catalog
+        [("ghost:1",), ("ghost:1", "beta:1"), ("ghost:1",), ("ghost:1", "beta:2")],
+        # Removals and mixed toggles, with the representative source component changing
+        [("ghost:2", "beta:1"), ("ghost:1", "ghost:2", "beta:1"), ("ghost:1", "beta:1")],
+        # Dependency satisfied by a component outside the catalog
+        [("alpha:1",), ("alpha:1", "ghost:3"), ("alpha:1", "ghost:3", "beta:2"), ("alpha:1",)],
+        # Source group member removed, then added, on a rule whose target is outside the catalog
+        [("alpha:1", "beta:1", "ghost:1"), ("beta:1", "ghost:1")],
+        [("beta:1", "ghost:1"), ("alpha:1", "beta:1", "ghost:1")],
+    ],
+)
+def test_incremental_validation_matches_full_validation(
+    rule_manager: RuleManager, tmp_path: Path, steps: list[tuple[str, ...]]
+) -> None:
+    for step, names in enumerate(steps):
+        selection = _refs(*names)
+        incremental = _violation_keys(rule_manager.validate_selection(selection))
+
+        # A fresh manager has no previous selection: it validates in a full pass
+        reference_dir = tmp_path / f"reference_{step}"
+        reference_dir.mkdir()
+        full = _violation_keys(_load_rule_manager(reference_dir).validate_selection(selection))
+
+        assert incremental == full, names
@@ -555,7 +555,7 @@ class InstallationPage(BasePage):
                         mod=None,
                         component=None,
                         sequence_idx=idx,
-                        requirements=set(),
+                        requirements=frozenset(),
                         subcomponent_answers=[],
                         extra_args=[],
                     )
@@ -21,7 +21,7 @@ from constants import (
 from core.ComponentReference import ComponentReference
 from core.ModManager import ModManager
 from core.RuleManager import RuleManager
-from core.Rules import OrderDirection, OrderRule
+from core.Rules import OrderDirection, OrderRule, RuleType
 from core.TranslationManager import tr
 from ui.widgets.HoverTableWidget import HoverTableWidget
 
@@ -152,6 +152,12 @@ class OrderViolationPanel(QWidget):
         rows = list(rule_ref_data.values())
         self._table.setRowCount(len(rows))
 
+        # Resolve type labels once instead of once per row
+        type_labels = {
+            rule_type: tr(f"page.selection.violation.type_{rule_type.value}")
+            for rule_type in RuleType
+        }
+
         for row, (violation, ref, befores, afters) in enumerate(rows):
             is_broad = violation.is_broad_rule()
             base_color = QColor(COLOR_ERROR if violation.is_error else COLOR_WARNING)
@@ -180,9 +186,7 @@ class OrderViolationPanel(QWidget):
             icon_item.setData(Qt.ItemDataRole.UserRole, violation)
             icon_item.setToolTip(violation.get_order_message(ref, self._current_order))
 
-            type_item = make_item(
-                tr(f"page.selection.violation.type_{violation.rule.rule_type.value}")
-            )
+            type_item = make_item(type_labels[violation.rule.rule_type])
             type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
 
             self._table.setItem(row, COL_ICON, icon_item)
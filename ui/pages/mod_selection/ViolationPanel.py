@@ -21,7 +21,7 @@ from constants import (
     SPACING_SMALL,
 )
 from core.ComponentReference import ComponentReference, IndexManager
-from core.Rules import RuleViolation
+from core.Rules import RuleType, RuleViolation
 from core.TranslationManager import tr
 from core.ValidationOrchestrator import ValidationOrchestrator
 from ui.pages.mod_selection.ComponentContextMenu import ComponentContextMenu
@@ -154,9 +154,9 @@ class ViolationPanel(QWidget):
         """Populate the table with violations."""
         filtered = {}
         for violation in violations:
-            sources = tuple(sorted(violation.rule.sources, key=str))
-            targets = tuple(sorted(violation.rule.targets, key=str))
-            key = tuple(sorted((sources, targets), key=str))
+            sources = tuple(sorted(violation.rule.sources))
+            targets = tuple(sorted(violation.rule.targets))
+            key = tuple(sorted((sources, targets)))
 
             if key not in filtered or (
                 self._current_reference in violation.rule.sources
@@ -168,6 +168,12 @@ class ViolationPanel(QWidget):
 
         self._table.setRowCount(len(violations))
 
+        # Resolve type labels once instead of once per row
+        type_labels = {
+            rule_type: tr(f"page.selection.violation.type_{rule_type.value}")
+            for rule_type in RuleType
+        }
+
         for row, violation in enumerate(violations):
             if violation.is_error:
                 icon = ICON_ERROR
@@ -184,9 +190,7 @@ class ViolationPanel(QWidget):
             self._table.setItem(row, 0, icon_item)
 
             # Column 1: Type
-            type_item = QTableWidgetItem(
-                tr(f"page.selection.violation.type_{violation.rule.rule_type.value}")
-            )
+            type_item = QTableWidgetItem(type_labels[violation.rule.rule_type])
             type_item.setForeground(color)
             type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             self._table.setItem(row, 1, type_item)